@@ -4,8 +4,22 @@ from pypdf import PdfReader, PdfWriter
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import io
-
-def format_ic_number(text, space_after_positions=[6, 8]):
+import logging
+from collections import namedtuple
+from functools import lru_cache
+from operator import itemgetter
+
+logger = logging.getLogger(__name__)
+
+# Overlay font shared by every request. Helvetica is one of the standard 14
+# fonts, so its metrics are loaded once here and every overlay canvas starts
+# with it already selected instead of rebuilding that state per request.
+OVERLAY_FONT_NAME = "Helvetica"
+OVERLAY_FONT_SIZE = 10
+GRID_FONT_SIZE = 6
+pdfmetrics.getFont(OVERLAY_FONT_NAME)
+
+def format_ic_number(text, space_after_positions=(6, 8)):
     """
     Format IC number by inserting spaces at specific positions
     Example: "123456789012" with positions [6, 8] becomes "123456 78 9012"
@@ -17,13 +31,26 @@ def format_ic_number(text, space_after_positions=[6, 8]):
     Returns:
         Formatted text with spaces
     """
-    result = []
-    for i, char in enumerate(text):
-        result.append(char)
-        # Check if we need to add space after this position (1-indexed)
-        if (i + 1) in space_after_positions and (i + 1) < len(text):
-            result.append(' ')
-    return ''.join(result)
+    # Positions may arrive as a list from field_data; the cache needs a hashable key
+    chunk_bounds = _ic_chunk_bounds(tuple(space_after_positions), len(text))
+    return ' '.join([text[start:end] for start, end in chunk_bounds])
+
+
+@lru_cache(maxsize=256)
+def _ic_chunk_bounds(space_after_positions, length):
+    """
+    Work out the (start, end) slice of each space-separated chunk once per layout
+
+    Args:
+        space_after_positions: Tuple of positions after which to insert spaces (1-indexed)
+        length: Length of the text being formatted
+
+    Returns:
+        Tuple of (start, end) slice bounds, one per chunk
+    """
+    # Only positions that fall inside the text split it
+    cuts = sorted({pos for pos in space_after_positions if 0 < pos < length})
+    return tuple(zip([0] + cuts, cuts + [length]))
 
 
 def format_phone_number(text, space_after_position=3, add_leading_space=False):
@@ -39,7 +66,7 @@ def format_phone_number(text, space_after_position=3, add_leading_space=False):
         Formatted text with spaces
     """
     text = text.strip()
-    formatted = format_ic_number(text, space_after_positions=[space_after_position])
+    formatted = format_ic_number(text, (space_after_position,))
 
     if add_leading_space:
         formatted = ' ' + formatted
@@ -127,6 +154,25 @@ def fill_phone_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
     return positions
 
 
+@lru_cache(maxsize=256)
+def box_x_positions(start_x, box_width, box_spacing, count):
+    """
+    Calculate the x position of each box in a row of equally sized boxes.
+    Results are cached, so fields sharing the same grid geometry share one tuple.
+
+    Args:
+        start_x: X coordinate of the first box
+        box_width: Width of each box
+        box_spacing: Spacing between boxes
+        count: Number of boxes in the row
+
+    Returns:
+        Tuple of x positions, one per box
+    """
+    step = box_width + box_spacing
+    return tuple(start_x + (col * step) for col in range(count))
+
+
 def fill_sequential_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
                           boxes_per_row=20, row_height=20, max_rows=3):
     """
@@ -146,29 +192,17 @@ def fill_sequential_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
     Returns:
         List of tuples (char, x_pos, y_pos)
     """
-    positions = []
     total_boxes = boxes_per_row * max_rows
-    char_index = 0
+    row_x_positions = box_x_positions(start_x, box_width, box_spacing, boxes_per_row)
 
-    for row in range(max_rows):
-        for col in range(boxes_per_row):
-            if char_index >= len(text):
-                break  # No more characters to place
+    if len(text) > total_boxes:
+        logger.warning("Text %r truncated. Only %d/%d characters fit in %d boxes.", text, total_boxes, len(text), total_boxes)
 
-            char = text[char_index]
-            x_pos = start_x + (col * (box_width + box_spacing))
-            y_pos = start_y - (row * row_height)
-
-            positions.append((char, x_pos, y_pos))
-            char_index += 1
-
-        if char_index >= len(text):
-            break  # No more characters to place
-
-    if char_index < len(text):
-        print(f"Warning: Text '{text}' truncated. Only {char_index}/{len(text)} characters fit in {total_boxes} boxes.")
-
-    return positions
+    # Box i sits in row i // boxes_per_row, column i % boxes_per_row
+    return [
+        (char, row_x_positions[i % boxes_per_row], start_y - ((i // boxes_per_row) * row_height))
+        for i, char in enumerate(text[:total_boxes])
+    ]
 
 
 def fill_character_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
@@ -193,20 +227,34 @@ def fill_character_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
     Returns:
         List of tuples (char, x_pos, y_pos)
     """
-    positions = []
-
     # Remove commas if specified
     if remove_commas:
         text = text.replace(',', '')
-        print(f"After removing commas: '{text}'")
+
+    # Fast path: a single word (no spaces or forced line breaks) goes on one row -
+    # the first row if it fits, otherwise the next row, overflowing past the last box
+    if ' ' not in text and not (respect_newlines and '\n' in text):
+        row = 0 if len(text) <= boxes_per_row else 1
+        if row >= max_rows:
+            logger.warning("Text %r exceeds %d rows. Truncating...", text, max_rows)
+            return []
+
+        row_x_positions = box_x_positions(start_x, box_width, box_spacing, boxes_per_row)
+        step = box_width + box_spacing
+        y_pos = start_y - (row * row_height)
+        return [
+            (char, row_x_positions[col] if col < boxes_per_row else start_x + (col * step), y_pos)
+            for col, char in enumerate(text)
+        ]
 
     # If respecting newlines, split by newlines first
     if respect_newlines:
         lines = text.split('\n')
-        print(f"Split into {len(lines)} lines by newlines")
     else:
         lines = [text]
 
+    # Pass 1: word-wrap the text into (char, row, col) cells
+    cells = []
     current_row = 0
 
     for line_idx, line in enumerate(lines):
@@ -214,56 +262,253 @@ def fill_character_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
         current_col = 0
         words = line.split(' ')  # Split by space to get words
 
-        print(f"Processing line {line_idx + 1}: '{line}'")
-
         for word_idx, word in enumerate(words):
-            word_length = len(word)
-
-            print(f"  Processing word '{word}' (length={word_length}) at row={current_row}, col={current_col}")
-
             # Check if we exceed max rows before processing this word
             if current_row >= max_rows:
-                print(f"Warning: Text '{text}' exceeds {max_rows} rows. Truncating...")
+                logger.warning("Text %r exceeds %d rows. Truncating...", text, max_rows)
                 break
 
-            # Check if current word fits in the remaining space of current row
-            remaining_boxes = boxes_per_row - current_col
-            print(f"    Remaining boxes in row: {remaining_boxes}")
-
-            if current_col + word_length > boxes_per_row:
-                # Word doesn't fit, move to next row
-                print(f"    Word doesn't fit, moving to next row")
+            if current_col + len(word) > boxes_per_row:
+                # Word doesn't fit in the remaining space of this row, move to next row
                 current_row += 1
                 current_col = 0
 
                 # Check again if we exceed max rows after moving to next row
                 if current_row >= max_rows:
-                    print(f"Warning: Text '{text}' exceeds {max_rows} rows. Truncating...")
+                    logger.warning("Text %r exceeds %d rows. Truncating...", text, max_rows)
                     break
 
-            # Place each character of the word (word is guaranteed to fit now)
-            for char in word:
-                # Calculate position
-                x_pos = start_x + (current_col * (box_width + box_spacing))
-                y_pos = start_y - (current_row * row_height)  # Subtract to move DOWN (PDF coordinates)
-
-                positions.append((char, x_pos, y_pos))
-                current_col += 1
-
-            print(f"    After placing word: row={current_row}, col={current_col}")
+            cells.extend((char, current_row, current_col + i) for i, char in enumerate(word))
+            current_col += len(word)
 
             # Add space after word (except for last word in line)
             if word_idx < len(words) - 1:
                 # Space takes up one box position but we don't render it
                 current_col += 1
-                print(f"    After space: row={current_row}, col={current_col}")
 
         # Move to next row after each line (except last line)
         if respect_newlines and line_idx < len(lines) - 1:
             current_row += 1
-            print(f"  Moving to next row due to newline: row={current_row}")
 
-    return positions
+    # Pass 2: turn cells into coordinates. A word longer than a row overflows
+    # past the last box, so those columns are computed directly.
+    row_x_positions = box_x_positions(start_x, box_width, box_spacing, boxes_per_row)
+    step = box_width + box_spacing
+
+    return [
+        (char,
+         row_x_positions[col] if col < boxes_per_row else start_x + (col * step),
+         start_y - (row * row_height))  # Subtract to move DOWN (PDF coordinates)
+        for char, row, col in cells
+    ]
+
+# A field_data entry with every option resolved to its default once, so the
+# renderer reads attributes instead of probing the dict with .get() per option.
+# `kind` selects how the text is laid out (see _field_kind and _BOX_LAYOUTS).
+FieldSpec = namedtuple('FieldSpec', [
+    'text', 'x', 'y', 'size', 'kind',
+    'checkbox_options',
+    'conditional_on', 'conditional_field', 'conditional_value',
+    'format_ic', 'ic_space_positions',
+    'format_phone', 'phone_space_position', 'phone_leading_space', 'phone_space_separator_width',
+    'add_leading_space_if_single',
+    'box_width', 'box_spacing', 'boxes_per_row', 'row_height', 'max_rows',
+    'separator_width', 'separator_char',
+    'remove_commas', 'respect_newlines',
+])
+
+
+# Default for every FieldSpec option; a field's own settings are merged over these
+_FIELD_DEFAULTS = {
+    'x': None,
+    'y': None,
+    'size': 10,
+    'checkbox_options': {},
+    'conditional_on': False,
+    'conditional_field': None,
+    'conditional_value': None,
+    'format_ic': False,
+    'ic_space_positions': (6, 8),
+    'format_phone': False,
+    'phone_space_position': 3,
+    'phone_leading_space': False,
+    'phone_space_separator_width': 7,
+    'add_leading_space_if_single': False,
+    'box_width': 15,
+    'box_spacing': 2,
+    'boxes_per_row': 20,
+    'row_height': 20,
+    'max_rows': 3,
+    'separator_width': 7,
+    'separator_char': '-',
+    'remove_commas': False,
+    'respect_newlines': False,
+}
+
+# Pulls the FieldSpec values out of a merged field dict in one C-level call
+_field_spec_values = itemgetter(*FieldSpec._fields)
+
+
+def _field_kind(data):
+    """
+    Work out how a field is laid out, in the same precedence the flags always had
+
+    Args:
+        data: Field dictionary from field_data
+
+    Returns:
+        One of 'checkbox', 'phone', 'date', 'sequential', 'boxes', 'text'
+    """
+    if data.get('is_checkbox', False):
+        return 'checkbox'
+    if data.get('is_phone', False):
+        return 'phone'
+    if data.get('is_date', False):
+        return 'date'
+    if data.get('fill_sequential', False):
+        return 'sequential'
+    if data.get('use_boxes', False):
+        return 'boxes'
+    return 'text'
+
+
+def field_spec(data):
+    """
+    Resolve a field_data entry into a FieldSpec with all defaults filled in
+
+    Args:
+        data: Field dictionary from field_data
+
+    Returns:
+        FieldSpec for the field
+    """
+    # One merge over the defaults replaces a .get() per option
+    values = {**_FIELD_DEFAULTS, **data, 'kind': _field_kind(data)}
+    return FieldSpec._make(_field_spec_values(values))
+
+
+def _phone_positions(text, x, y, spec):
+    """Box positions for a phone field with a custom-width space separator"""
+    return fill_phone_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        space_separator_width=spec.phone_space_separator_width,
+        space_after_position=spec.phone_space_position,
+        add_leading_space=spec.phone_leading_space
+    )
+
+
+def _date_positions(text, x, y, spec):
+    """Box positions for a date field with narrower separator boxes"""
+    return fill_date_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        separator_width=spec.separator_width,
+        separator_char=spec.separator_char
+    )
+
+
+def _sequential_positions(text, x, y, spec):
+    """Box positions for sequential filling (no word wrapping)"""
+    return fill_sequential_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        boxes_per_row=spec.boxes_per_row,
+        row_height=spec.row_height,
+        max_rows=spec.max_rows
+    )
+
+
+def _character_box_positions(text, x, y, spec):
+    """Box positions for word-wrapped character boxes"""
+    return fill_character_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        boxes_per_row=spec.boxes_per_row,
+        row_height=spec.row_height,
+        max_rows=spec.max_rows,
+        remove_commas=spec.remove_commas,
+        respect_newlines=spec.respect_newlines
+    )
+
+
+# Field kind -> function returning its (char, x, y) box positions.
+# Kinds missing here ('text') are drawn as a single string.
+_BOX_LAYOUTS = {
+    'phone': _phone_positions,
+    'date': _date_positions,
+    'sequential': _sequential_positions,
+    'boxes': _character_box_positions,
+}
+
+
+def _draw_grid(can, width, height):
+    """
+    Draw a coordinate grid with 10-unit spacing and labels every 50 units
+
+    Args:
+        can: ReportLab canvas to draw on
+        width: Page width
+        height: Page height
+    """
+    can.setStrokeColorRGB(0.8, 0.8, 0.8)  # Light gray
+    can.setLineWidth(0.5)
+
+    # Build every grid line into one path so it is stroked with a single operator
+    grid = can.beginPath()
+
+    # Vertical lines (every 10 units along x-axis)
+    for x in range(0, int(width) + 1, 10):
+        grid.moveTo(x, 0)
+        grid.lineTo(x, height)
+
+    # Horizontal lines (every 10 units along y-axis from top)
+    for y_from_top in range(0, int(height) + 1, 10):
+        y_from_bottom = height - y_from_top
+        grid.moveTo(0, y_from_bottom)
+        grid.lineTo(width, y_from_bottom)
+
+    can.drawPath(grid, stroke=1, fill=0)
+
+    # Label every 50 units
+    can.setFont(OVERLAY_FONT_NAME, GRID_FONT_SIZE)
+
+    can.setFillColorRGB(1, 0, 0)  # Red text
+    for x in range(0, int(width) + 1, 50):
+        can.drawString(x + 2, height - 10, f"x={x}")  # Top
+        can.drawString(x + 2, 5, f"x={x}")  # Bottom
+
+    can.setFillColorRGB(0, 0, 1)  # Blue text
+    for y_from_top in range(0, int(height) + 1, 50):
+        y_from_bottom = height - y_from_top
+        can.drawString(2, y_from_bottom + 2, f"y={y_from_top}")  # Left
+        can.drawString(width - 35, y_from_bottom + 2, f"y={y_from_top}")  # Right
+
+    can.setFillColorRGB(0, 0, 0)  # Back to black
+
+
+@lru_cache(maxsize=4)
+def _grid_operators(width, height):
+    """
+    Render the coordinate grid once and cache its PDF operators
+
+    Args:
+        width: Page width
+        height: Page height
+
+    Returns:
+        Tuple of content stream operators that can be replayed on any overlay canvas
+    """
+    scratch = canvas.Canvas(io.BytesIO(), pagesize=(width, height),
+                            initialFontName=OVERLAY_FONT_NAME,
+                            initialFontSize=OVERLAY_FONT_SIZE)
+    _draw_grid(scratch, width, height)
+    return tuple(scratch._code)
+
 
 def create_overlay_pdf(field_data, draw_grid=False):
     """
@@ -279,149 +524,111 @@ def create_overlay_pdf(field_data, draw_grid=False):
     """
     packet = io.BytesIO()
 
-    # Get page size from original PDF
-    can = canvas.Canvas(packet, pagesize=A4)
+    # Get page size from original PDF. The overlay is only an intermediate that
+    # merge_page decodes straight away, so its content stream is left uncompressed
+    # rather than deflated here and inflated again in fill_pdf_with_overlay.
+    can = canvas.Canvas(packet, pagesize=A4,
+                        initialFontName=OVERLAY_FONT_NAME,
+                        initialFontSize=OVERLAY_FONT_SIZE,
+                        pageCompression=0)
     width, height = A4
 
-    # Draw grid if requested
+    # All field text goes into a single text object (one BT/ET block)
+    text_obj = can.beginText()
+
+    # Only emit a font change when the size actually differs from the last one
+    current_font_size = OVERLAY_FONT_SIZE
+
+    def set_font_size(font_size):
+        nonlocal current_font_size
+        if font_size != current_font_size:
+            text_obj.setFont(OVERLAY_FONT_NAME, font_size)
+            current_font_size = font_size
+
+    def draw_string(x, y, text):
+        """Add a string at an absolute position to the text object"""
+        text_obj.setTextOrigin(x, y)
+        text_obj.textOut(text)
+
+    def draw_box_chars(positions):
+        """Add one field's box characters to the text object"""
+        cursor = None
+        for char, char_x, char_y in positions:
+            if not char:
+                continue  # Only draw non-empty characters (skip separators)
+            x, y = char_x + 2, char_y - 3  # Slight offset for centering
+            if cursor is None:
+                text_obj.setTextOrigin(x, y)
+            else:
+                # Relative move from the previous character (positive dy moves down)
+                text_obj.moveCursor(x - cursor[0], cursor[1] - y)
+            text_obj.textOut(char)
+            cursor = (x, y)
+
+    # Draw grid if requested (operators are built once and replayed)
     if draw_grid:
-        can.setStrokeColorRGB(0.8, 0.8, 0.8)  # Light gray
-        can.setLineWidth(0.5)
-        can.setFont("Helvetica", 6)
-
-        # Draw vertical lines (every 10 units along x-axis)
-        for x in range(0, int(width) + 1, 10):
-            can.line(x, 0, x, height)
-            # Label every 50 units at top and bottom
-            if x % 50 == 0:
-                can.setFillColorRGB(1, 0, 0)  # Red text
-                can.drawString(x + 2, height - 10, f"x={x}")  # Top
-                can.drawString(x + 2, 5, f"x={x}")  # Bottom
-                can.setFillColorRGB(0, 0, 0)  # Back to black
-
-        # Draw horizontal lines (every 10 units along y-axis from top)
-        for y_from_top in range(0, int(height) + 1, 10):
-            y_from_bottom = height - y_from_top
-            can.line(0, y_from_bottom, width, y_from_bottom)
-            # Label every 50 units at left and right
-            if y_from_top % 50 == 0:
-                can.setFillColorRGB(0, 0, 1)  # Blue text
-                can.drawString(2, y_from_bottom + 2, f"y={y_from_top}")  # Left
-                can.drawString(width - 35, y_from_bottom + 2, f"y={y_from_top}")  # Right
-                can.setFillColorRGB(0, 0, 0)  # Back to black
-
-    # Try to use a standard font (Arial or Helvetica)
-    can.setFont("Helvetica", 10)
+        can._code.extend(_grid_operators(width, height))
+        current_font_size = GRID_FONT_SIZE  # Grid labels leave the font at this size
+
+    # Resolve every field once, then draw grouped by font size so same-size fields
+    # share one font change (sorted() is stable, so equal sizes keep their order)
+    specs = sorted(((field_name, field_spec(data)) for field_name, data in field_data.items()),
+                   key=lambda item: item[1].size)
 
     # Draw each field
-    for field_name, data in field_data.items():
-        text = data['text']
+    for field_name, spec in specs:
+        text = spec.text
 
         # Check if this is a checkbox/option field
-        if data.get('is_checkbox', False):
-            font_size = data.get('size', 10)
-            can.setFont("Helvetica", font_size)
-
-            checkbox_options = data.get('checkbox_options', {})
-            # Find which option matches the text
-            for option_value, coords in checkbox_options.items():
-                if text == option_value:
-                    # Draw the checkmark "/" at the specified coordinates
-                    check_x = coords['x']
-                    check_y = height - coords['y']  # Convert from top-left to bottom-left
-                    can.drawString(check_x, check_y, "/")
-                    print(f"Checkbox '{option_value}' marked at ({check_x}, {check_y})")
-                    break
+        if spec.kind == 'checkbox':
+            set_font_size(spec.size)
+
+            # Look up the option matching the text (options are keyed by their value)
+            coords = spec.checkbox_options.get(text)
+            if coords is not None:
+                # Draw the checkmark "/" at the specified coordinates
+                check_x = coords['x']
+                check_y = height - coords['y']  # Convert from top-left to bottom-left
+                draw_string(check_x, check_y, "/")
+                logger.debug("Checkbox %r marked at (%s, %s)", text, check_x, check_y)
             continue  # Skip to next field
 
         # Check if this field is conditional and should be skipped
-        if data.get('conditional_on', False):
-            parent_field = data.get('conditional_field')
-            required_value = data.get('conditional_value')
+        if spec.conditional_on:
             # Check if parent field exists and has the required value
-            if parent_field in field_data:
-                if field_data[parent_field].get('text') != required_value:
+            if spec.conditional_field in field_data:
+                if field_data[spec.conditional_field].get('text') != spec.conditional_value:
                     continue  # Skip this field
 
         # Apply IC number formatting if specified
-        if data.get('format_ic', False):
-            space_positions = data.get('ic_space_positions', [6, 8])
-            text = format_ic_number(text, space_positions)
-            print(f"IC formatted: '{data['text']}' -> '{text}'")
+        if spec.format_ic:
+            text = format_ic_number(text, spec.ic_space_positions)
+            logger.debug("IC formatted: %r -> %r", spec.text, text)
 
         # Apply phone number formatting if specified
-        if data.get('format_phone', False):
-            space_pos = data.get('phone_space_position', 3)
-            leading_space = data.get('phone_leading_space', False)
-            text = format_phone_number(text, space_after_position=space_pos, add_leading_space=leading_space)
-            print(f"Phone formatted: '{data['text']}' -> '{text}'")
+        if spec.format_phone:
+            text = format_phone_number(text, space_after_position=spec.phone_space_position,
+                                       add_leading_space=spec.phone_leading_space)
+            logger.debug("Phone formatted: %r -> %r", spec.text, text)
 
         # Add leading space if single character and specified
-        if data.get('add_leading_space_if_single', False):
+        if spec.add_leading_space_if_single:
             if len(text.strip()) == 1:
                 text = ' ' + text.strip()
-                print(f"Added leading space for single character: '{data['text']}' -> '{text}'")
-
-        x = data['x']
-        y = height - data['y']  # Convert from top-left to bottom-left origin
-        font_size = data.get('size', 10)
-
-        can.setFont("Helvetica", font_size)
-
-        # Check if this is a phone field with custom space separator width
-        if data.get('is_phone', False):
-            positions = fill_phone_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                space_separator_width=data.get('phone_space_separator_width', 7),
-                space_after_position=data.get('phone_space_position', 3),
-                add_leading_space=data.get('phone_leading_space', False)
-            )
-            for char, char_x, char_y in positions:
-                if char:  # Only draw non-empty characters (skip separators)
-                    can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
-        # Check if this is a date field with special separator boxes
-        elif data.get('is_date', False):
-            positions = fill_date_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                separator_width=data.get('separator_width', 7),
-                separator_char=data.get('separator_char', '-')
-            )
-            for char, char_x, char_y in positions:
-                if char:  # Only draw non-empty characters (skip separators)
-                    can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
-        # Check if this field should use sequential box filling (no word wrapping)
-        elif data.get('fill_sequential', False):
-            positions = fill_sequential_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                boxes_per_row=data.get('boxes_per_row', 20),
-                row_height=data.get('row_height', 20),
-                max_rows=data.get('max_rows', 3)
-            )
-            for char, char_x, char_y in positions:
-                can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
-        # Check if this field should use character boxes
-        elif data.get('use_boxes', False):
-            positions = fill_character_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                boxes_per_row=data.get('boxes_per_row', 20),
-                row_height=data.get('row_height', 20),
-                max_rows=data.get('max_rows', 3),
-                remove_commas=data.get('remove_commas', False),
-                respect_newlines=data.get('respect_newlines', False)
-            )
-            for char, char_x, char_y in positions:
-                can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
+                logger.debug("Added leading space for single character: %r -> %r", spec.text, text)
+
+        x = spec.x
+        y = height - spec.y  # Convert from top-left to bottom-left origin
+
+        set_font_size(spec.size)
+
+        layout = _BOX_LAYOUTS.get(spec.kind)
+        if layout is not None:
+            draw_box_chars(layout(text, x, y, spec))
         else:
-            can.drawString(x, y, text)
+            draw_string(x, y, text)
 
+    can.drawText(text_obj)
     can.save()
     packet.seek(0)
     return packet
@@ -432,38 +639,36 @@ def fill_pdf_with_overlay(input_pdf, output_pdf, field_data, draw_grid=False):
 
     Args:
         input_pdf: Path to input PDF file
-        output_pdf: Path to output filled PDF file
+        output_pdf: Path to output filled PDF file, or a writable binary
+                    file object (e.g. io.BytesIO) to keep the result in memory
         field_data: Dictionary with field data and positions
         draw_grid: If True, draw coordinate grid on PDF
     """
     # Create overlay PDF
     overlay_pdf = create_overlay_pdf(field_data, draw_grid=draw_grid)
 
-    # Read the original PDF
-    original_pdf = PdfReader(input_pdf)
+    # Open the original PDF for an incremental update: its bytes are kept as-is
+    # and only the modified first page is appended after them on write
+    writer = PdfWriter(input_pdf, incremental=True)
     overlay = PdfReader(overlay_pdf)
 
-    # Create output PDF
-    writer = PdfWriter()
-
-    # Merge overlay with first page
-    page = original_pdf.pages[0]
-    page.merge_page(overlay.pages[0])
-    writer.add_page(page)
-
-    # Add remaining pages without modification
-    for page_num in range(1, len(original_pdf.pages)):
-        writer.add_page(original_pdf.pages[page_num])
+    # Merge overlay with first page (remaining pages are left untouched)
+    writer.pages[0].merge_page(overlay.pages[0])
 
     # Write output
-    with open(output_pdf, 'wb') as output_file:
-        writer.write(output_file)
-
-    print(f"PDF filled successfully! Saved to: {output_pdf}")
+    if hasattr(output_pdf, 'write'):
+        writer.write(output_pdf)
+        logger.info("PDF filled successfully! Written to in-memory output")
+    else:
+        with open(output_pdf, 'wb') as output_file:
+            writer.write(output_file)
+        logger.info("PDF filled successfully! Saved to: %s", output_pdf)
 
 if __name__ == "__main__":
     import os
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
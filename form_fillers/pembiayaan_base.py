@@ -4,8 +4,23 @@ from pypdf import PdfReader, PdfWriter
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import io
-
-def format_ic_number(text, space_after_positions=[6, 8]):
+import logging
+from collections import namedtuple
+from functools import lru_cache
+from operator import itemgetter
+from itertools import accumulate
+
+logger = logging.getLogger(__name__)
+
+# Overlay font shared by every request. Helvetica is one of the standard 14
+# fonts, so its metrics are loaded once here and every overlay canvas starts
+# with it already selected instead of rebuilding that state per request.
+OVERLAY_FONT_NAME = "Helvetica"
+OVERLAY_FONT_SIZE = 10
+GRID_FONT_SIZE = 6
+pdfmetrics.getFont(OVERLAY_FONT_NAME)
+
+def format_ic_number(text, space_after_positions=(6, 8)):
     """
     Format IC number by inserting spaces at specific positions
     Example: "123456789012" with positions [6, 8] becomes "123456 78 9012"
@@ -17,13 +32,26 @@ def format_ic_number(text, space_after_positions=[6, 8]):
     Returns:
         Formatted text with spaces
     """
-    result = []
-    for i, char in enumerate(text):
-        result.append(char)
-        # Check if we need to add space after this position (1-indexed)
-        if (i + 1) in space_after_positions and (i + 1) < len(text):
-            result.append(' ')
-    return ''.join(result)
+    # Positions may arrive as a list from field_data; the cache needs a hashable key
+    chunk_bounds = _ic_chunk_bounds(tuple(space_after_positions), len(text))
+    return ' '.join([text[start:end] for start, end in chunk_bounds])
+
+
+@lru_cache(maxsize=256)
+def _ic_chunk_bounds(space_after_positions, length):
+    """
+    Work out the (start, end) slice of each space-separated chunk once per layout
+
+    Args:
+        space_after_positions: Tuple of positions after which to insert spaces (1-indexed)
+        length: Length of the text being formatted
+
+    Returns:
+        Tuple of (start, end) slice bounds, one per chunk
+    """
+    # Only positions that fall inside the text split it
+    cuts = sorted({pos for pos in space_after_positions if 0 < pos < length})
+    return tuple(zip([0] + cuts, cuts + [length]))
 
 
 def format_phone_number(text, space_after_position=3, add_leading_space=False):
@@ -39,7 +67,7 @@ def format_phone_number(text, space_after_position=3, add_leading_space=False):
         Formatted text with spaces
     """
     text = text.strip()
-    formatted = format_ic_number(text, space_after_positions=[space_after_position])
+    formatted = format_ic_number(text, (space_after_position,))
 
     if add_leading_space:
         formatted = ' ' + formatted
@@ -83,9 +111,7 @@ def format_decimal_amount(text):
         decimal_part = "00"
 
     # Return formatted with exactly 2 decimal places
-    result = f"{integer_part}.{decimal_part}"
-    print(f"Decimal formatted: '{text}' -> '{result}'")
-    return result
+    return f"{integer_part}.{decimal_part}"
 
 
 def fill_date_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
@@ -191,75 +217,108 @@ def fill_conditional_phone_boxes(text, start_x, start_y, box_width=15, box_spaci
     Returns:
         List of tuples (char, x_pos, y_pos) - space returns empty string ''
     """
-    positions = []
     text = text.strip()
 
     # Check if we should fill left-to-right or right-to-left
     if len(text) > check_position and text[check_position] == check_value:
-        # Fill left-to-right (mobile number starting with "01")
-        fill_direction = "left-to-right"
-        print(f"Phone '{text}': Character at position {check_position} is '{check_value}' - filling {fill_direction}")
-
-        current_x = start_x
-        for i, char in enumerate(text):
-            x_pos = current_x
-            y_pos = start_y
-
-            positions.append((char, x_pos, y_pos))
-            current_x += box_width + box_spacing
+        # Fill left-to-right (mobile number starting with "01") - same layout as a plain phone field
+        logger.debug("Phone %r: character at position %d is %r - filling left-to-right", text, check_position, check_value)
+        return fill_phone_boxes(text, start_x, start_y, box_width=box_width, box_spacing=box_spacing,
+                                space_separator_width=space_separator_width,
+                                space_after_position=space_after_position)
+
+    # Fill right-to-left (landline number NOT starting with "01")
+    logger.debug("Phone %r: character at position %d is NOT %r - filling right-to-left", text, check_position, check_value)
+
+    # Slot layout (left to right): one leading empty box, then a box per character,
+    # with the space separator slotted in after space_after_position boxes.
+    # For "0345678901" (10 chars): Box1[empty], Box2[0], Box3[3], SPACE, Box4[4], ..., Box11[1]
+    step = box_width + box_spacing
+    has_separator = 1 <= space_after_position <= len(text) + 1
+    num_slots = len(text) + 1 + has_separator
+    separator_shift = space_separator_width - box_width  # Extra x for slots after the separator
 
-            # Add space separator after specified position
-            if (i + 1) == space_after_position and (i + 1) < len(text):
-                positions.append(('', current_x, y_pos))  # Empty space box
-                current_x += space_separator_width + box_spacing
-    else:
-        # Fill right-to-left (landline number NOT starting with "01")
-        fill_direction = "right-to-left"
-        print(f"Phone '{text}': Character at position {check_position} is NOT '{check_value}' - filling {fill_direction}")
-
-        # Calculate total boxes needed
-        # We need enough boxes to fit: text + 1 empty box at the start
-        text_length = len(text)
-        total_boxes = text_length + 1  # +1 for the leading empty box
+    positions = []
+    for i, char in enumerate(text):
+        # Character i goes to slot i + 1 (after the empty box), skipping the separator slot
+        slot = i + 1
+        if slot == space_after_position:
+            # Empty space box takes this slot, ahead of the character
+            positions.append(('', start_x + (space_after_position * step), start_y))
+        if slot >= space_after_position:
+            slot += 1
+
+        if slot < num_slots:
+            x_pos = start_x + (slot * step)
+            if has_separator and slot > space_after_position:
+                x_pos += separator_shift
+            positions.append((char, x_pos, start_y))
 
-        # Calculate positions for all boxes (left to right layout)
-        box_positions = []
-        current_x = start_x
+    return positions
 
-        for i in range(total_boxes):
-            box_positions.append(current_x)
-            current_x += box_width + box_spacing
 
-            # Add space separator after specified position
-            if (i + 1) == space_after_position:
-                # Add empty space separator
-                box_positions.append(current_x)  # This will be used for empty space
-                current_x += space_separator_width + box_spacing
+@lru_cache(maxsize=256)
+def box_x_positions(start_x, box_width, box_spacing, count):
+    """
+    Calculate the x position of each box in a row of equally sized boxes.
+    Results are cached, so fields sharing the same grid geometry share one tuple.
 
-        # Now we have box_positions for: [Box1(empty), Box2, Box3, SPACE, Box4, ..., Box11]
-        # For "0345678901" (10 chars), we want:
-        # Box1[empty], Box2[0], Box3[3], SPACE, Box4[4], Box5[5], ..., Box11[1]
+    Args:
+        start_x: X coordinate of the first box
+        box_width: Width of each box
+        box_spacing: Spacing between boxes
+        count: Number of boxes in the row
 
-        # Process characters one by one
-        for i, char in enumerate(text):
-            # Character index i (0-9) should go to box position (i+1)
-            # But we need to account for the space separator
-            box_idx = i + 1  # +1 to skip the first empty box
+    Returns:
+        Tuple of x positions, one per box
+    """
+    step = box_width + box_spacing
+    return tuple(start_x + (col * step) for col in range(count))
 
-            # If this box position is at or after the space, adjust index
-            if box_idx >= space_after_position:
-                box_idx += 1  # Skip the space separator position
 
-            if box_idx < len(box_positions):
-                x_pos = box_positions[box_idx]
-                positions.append((char, x_pos, start_y))
+@lru_cache(maxsize=256)
+def available_box_positions(start_x, start_y, box_width, box_spacing, boxes_per_row,
+                            row_height, max_rows, skip_boxes=(), skip_box_widths=()):
+    """
+    Calculate the (x, y) position of every fillable box in a sequential box grid.
+    Results are cached, so each field's layout is only worked out on its first render.
 
-            # Add space separator after specified position
-            if (i + 1) == space_after_position:
-                # Add empty space box
-                positions.append(('', box_positions[space_after_position], start_y))
+    Args:
+        start_x: Starting X coordinate
+        start_y: Starting Y coordinate (top of first row)
+        box_width: Width of each box (default width for non-skipped boxes)
+        box_spacing: Spacing between boxes
+        boxes_per_row: Number of boxes per row
+        row_height: Height between rows
+        max_rows: Maximum number of rows available
+        skip_boxes: Tuple of box positions to skip (1-indexed)
+        skip_box_widths: Tuple of (box position, width) pairs for skipped boxes
 
-    return positions
+    Returns:
+        Tuple of (x_pos, y_pos) pairs, one per available box, in fill order
+    """
+    skip_box_widths = dict(skip_box_widths)
+
+    # Calculate the x position of every available box in one pass per row.
+    # Skipped boxes are not filled, but their (custom) width still advances x.
+    skip_set = set(skip_boxes)
+    available_boxes = []
+    for row in range(max_rows):
+        y_pos = start_y - (row * row_height)
+        row_boxes = range(row * boxes_per_row + 1, (row + 1) * boxes_per_row + 1)  # 1-indexed
+        advances = [
+            (skip_box_widths.get(box_position, box_width) if box_position in skip_set else box_width)
+            + box_spacing
+            for box_position in row_boxes
+        ]
+        row_x_positions = accumulate(advances[:-1], initial=start_x)
+        available_boxes.extend(
+            (x_pos, y_pos)
+            for box_position, x_pos in zip(row_boxes, row_x_positions)
+            if box_position not in skip_set
+        )
+
+    return tuple(available_boxes)
 
 
 def fill_sequential_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
@@ -287,97 +346,31 @@ def fill_sequential_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
     Returns:
         List of tuples (char, x_pos, y_pos)
     """
-    positions = []
-    total_boxes = boxes_per_row * max_rows
-
     # If skip_box_widths not provided, use default box_width for all boxes
     if skip_box_widths is None:
         skip_box_widths = {}
 
+    # The box layout depends only on the field geometry, so it is computed once per field
+    available_boxes = available_box_positions(
+        start_x, start_y, box_width, box_spacing, boxes_per_row, row_height, max_rows,
+        tuple(skip_boxes), tuple(sorted(skip_box_widths.items()))
+    )
+
+    num_available = len(available_boxes)
+
     if fill_right_to_left:
-        # First, calculate the x position for each box (considering custom widths for skipped boxes)
-        box_x_positions = []  # Will store x position for each box (1-indexed)
-        current_x = start_x
-
-        for row in range(max_rows):
-            for col in range(boxes_per_row):
-                box_position = row * boxes_per_row + col + 1  # 1-indexed position
-                y_pos = start_y - (row * row_height)
-
-                # Get the width for this box
-                if box_position in skip_boxes:
-                    # Use custom width if specified, otherwise use default box_width
-                    current_box_width = skip_box_widths.get(box_position, box_width)
-                else:
-                    current_box_width = box_width
-
-                box_x_positions.append((box_position, current_x, y_pos, box_position in skip_boxes))
-                current_x += current_box_width + box_spacing
-
-            # Reset x position for next row
-            if row < max_rows - 1:
-                current_x = start_x
-
-        # Build list of available boxes (not skipped)
-        available_boxes = [(pos, x, y) for pos, x, y, is_skipped in box_x_positions if not is_skipped]
-
-        # Calculate how many boxes we need
-        text_length = len(text)
-        num_available = len(available_boxes)
-
-        if text_length > num_available:
-            print(f"Warning: Text '{text}' truncated. Only {num_available} boxes available.")
-            text_length = num_available
-
-        # Fill from the end (right to left)
-        start_index = num_available - text_length
-        for i, char in enumerate(text):
-            box_idx = start_index + i
-            if box_idx < len(available_boxes):
-                _, x_pos, y_pos = available_boxes[box_idx]
-                positions.append((char, x_pos, y_pos))
+        # Fill from the end (right to left): use the last len(text) boxes
+        if len(text) > num_available:
+            logger.warning("Text %r truncated. Only %d boxes available.", text, num_available)
+        start_index = max(num_available - len(text), 0)
+        boxes = available_boxes[start_index:]
     else:
-        # Left-to-right logic with custom skip box widths
-        # First, calculate the x position for each box (considering custom widths for skipped boxes)
-        box_x_positions = []  # Will store x position for each box (1-indexed)
-        current_x = start_x
-
-        for row in range(max_rows):
-            for col in range(boxes_per_row):
-                box_position = row * boxes_per_row + col + 1  # 1-indexed position
-                y_pos = start_y - (row * row_height)
-
-                # Get the width for this box
-                if box_position in skip_boxes:
-                    # Use custom width if specified, otherwise use default box_width
-                    current_box_width = skip_box_widths.get(box_position, box_width)
-                else:
-                    current_box_width = box_width
-
-                box_x_positions.append((box_position, current_x, y_pos, box_position in skip_boxes))
-                current_x += current_box_width + box_spacing
-
-            # Reset x position for next row
-            if row < max_rows - 1:
-                current_x = start_x
-
-        # Fill boxes left to right, skipping the ones in skip_boxes
-        char_index = 0
-        for box_position, x_pos, y_pos, is_skipped in box_x_positions:
-            if is_skipped:
-                continue  # Skip this box
-
-            if char_index >= len(text):
-                break  # No more characters to place
-
-            char = text[char_index]
-            positions.append((char, x_pos, y_pos))
-            char_index += 1
+        # Fill boxes left to right
+        if len(text) > num_available:
+            logger.warning("Text %r truncated. Only %d/%d characters fit in available boxes.", text, num_available, len(text))
+        boxes = available_boxes
 
-        if char_index < len(text):
-            print(f"Warning: Text '{text}' truncated. Only {char_index}/{len(text)} characters fit in available boxes.")
-
-    return positions
+    return [(char, x_pos, y_pos) for char, (x_pos, y_pos) in zip(text, boxes)]
 
 
 def fill_character_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
@@ -402,20 +395,34 @@ def fill_character_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
     Returns:
         List of tuples (char, x_pos, y_pos)
     """
-    positions = []
-
     # Remove commas if specified
     if remove_commas:
         text = text.replace(',', '')
-        print(f"After removing commas: '{text}'")
+
+    # Fast path: a single word (no spaces or forced line breaks) goes on one row -
+    # the first row if it fits, otherwise the next row, overflowing past the last box
+    if ' ' not in text and not (respect_newlines and '\n' in text):
+        row = 0 if len(text) <= boxes_per_row else 1
+        if row >= max_rows:
+            logger.warning("Text %r exceeds %d rows. Truncating...", text, max_rows)
+            return []
+
+        row_x_positions = box_x_positions(start_x, box_width, box_spacing, boxes_per_row)
+        step = box_width + box_spacing
+        y_pos = start_y - (row * row_height)
+        return [
+            (char, row_x_positions[col] if col < boxes_per_row else start_x + (col * step), y_pos)
+            for col, char in enumerate(text)
+        ]
 
     # If respecting newlines, split by newlines first
     if respect_newlines:
         lines = text.split('\n')
-        print(f"Split into {len(lines)} lines by newlines")
     else:
         lines = [text]
 
+    # Pass 1: word-wrap the text into (char, row, col) cells
+    cells = []
     current_row = 0
 
     for line_idx, line in enumerate(lines):
@@ -423,56 +430,280 @@ def fill_character_boxes(text, start_x, start_y, box_width=15, box_spacing=2,
         current_col = 0
         words = line.split(' ')  # Split by space to get words
 
-        print(f"Processing line {line_idx + 1}: '{line}'")
-
         for word_idx, word in enumerate(words):
-            word_length = len(word)
-
-            print(f"  Processing word '{word}' (length={word_length}) at row={current_row}, col={current_col}")
-
             # Check if we exceed max rows before processing this word
             if current_row >= max_rows:
-                print(f"Warning: Text '{text}' exceeds {max_rows} rows. Truncating...")
+                logger.warning("Text %r exceeds %d rows. Truncating...", text, max_rows)
                 break
 
-            # Check if current word fits in the remaining space of current row
-            remaining_boxes = boxes_per_row - current_col
-            print(f"    Remaining boxes in row: {remaining_boxes}")
-
-            if current_col + word_length > boxes_per_row:
-                # Word doesn't fit, move to next row
-                print(f"    Word doesn't fit, moving to next row")
+            if current_col + len(word) > boxes_per_row:
+                # Word doesn't fit in the remaining space of this row, move to next row
                 current_row += 1
                 current_col = 0
 
                 # Check again if we exceed max rows after moving to next row
                 if current_row >= max_rows:
-                    print(f"Warning: Text '{text}' exceeds {max_rows} rows. Truncating...")
+                    logger.warning("Text %r exceeds %d rows. Truncating...", text, max_rows)
                     break
 
-            # Place each character of the word (word is guaranteed to fit now)
-            for char in word:
-                # Calculate position
-                x_pos = start_x + (current_col * (box_width + box_spacing))
-                y_pos = start_y - (current_row * row_height)  # Subtract to move DOWN (PDF coordinates)
-
-                positions.append((char, x_pos, y_pos))
-                current_col += 1
-
-            print(f"    After placing word: row={current_row}, col={current_col}")
+            cells.extend((char, current_row, current_col + i) for i, char in enumerate(word))
+            current_col += len(word)
 
             # Add space after word (except for last word in line)
             if word_idx < len(words) - 1:
                 # Space takes up one box position but we don't render it
                 current_col += 1
-                print(f"    After space: row={current_row}, col={current_col}")
 
         # Move to next row after each line (except last line)
         if respect_newlines and line_idx < len(lines) - 1:
             current_row += 1
-            print(f"  Moving to next row due to newline: row={current_row}")
 
-    return positions
+    # Pass 2: turn cells into coordinates. A word longer than a row overflows
+    # past the last box, so those columns are computed directly.
+    row_x_positions = box_x_positions(start_x, box_width, box_spacing, boxes_per_row)
+    step = box_width + box_spacing
+
+    return [
+        (char,
+         row_x_positions[col] if col < boxes_per_row else start_x + (col * step),
+         start_y - (row * row_height))  # Subtract to move DOWN (PDF coordinates)
+        for char, row, col in cells
+    ]
+
+# A field_data entry with every option resolved to its default once, so the
+# renderer reads attributes instead of probing the dict with .get() per option.
+# `kind` selects how the text is laid out (see _field_kind and _BOX_LAYOUTS).
+FieldSpec = namedtuple('FieldSpec', [
+    'text', 'x', 'y', 'size', 'kind',
+    'checkbox_options',
+    'conditional_on', 'conditional_field', 'conditional_value',
+    'format_ic', 'ic_space_positions',
+    'format_phone', 'phone_space_position', 'phone_leading_space', 'phone_space_separator_width',
+    'phone_check_position', 'phone_check_value',
+    'format_decimal', 'add_leading_space_if_single',
+    'box_width', 'box_spacing', 'boxes_per_row', 'row_height', 'max_rows',
+    'separator_width', 'separator_char',
+    'skip_boxes', 'skip_box_widths', 'fill_right_to_left',
+    'remove_commas', 'respect_newlines',
+])
+
+
+# Default for every FieldSpec option; a field's own settings are merged over these
+_FIELD_DEFAULTS = {
+    'x': None,
+    'y': None,
+    'size': 10,
+    'checkbox_options': {},
+    'conditional_on': False,
+    'conditional_field': None,
+    'conditional_value': None,
+    'format_ic': False,
+    'ic_space_positions': (6, 8),
+    'format_phone': False,
+    'phone_space_position': 3,
+    'phone_leading_space': False,
+    'phone_space_separator_width': 7,
+    'phone_check_position': 1,
+    'phone_check_value': '1',
+    'format_decimal': False,
+    'add_leading_space_if_single': False,
+    'box_width': 15,
+    'box_spacing': 2,
+    'boxes_per_row': 20,
+    'row_height': 20,
+    'max_rows': 3,
+    'separator_width': 7,
+    'separator_char': '-',
+    'skip_boxes': (),
+    'skip_box_widths': None,
+    'fill_right_to_left': False,
+    'remove_commas': False,
+    'respect_newlines': False,
+}
+
+# Pulls the FieldSpec values out of a merged field dict in one C-level call
+_field_spec_values = itemgetter(*FieldSpec._fields)
+
+
+def _field_kind(data):
+    """
+    Work out how a field is laid out, in the same precedence the flags always had
+
+    Args:
+        data: Field dictionary from field_data
+
+    Returns:
+        One of 'checkbox', 'conditional_phone', 'phone', 'date', 'sequential', 'boxes', 'text'
+    """
+    if data.get('is_checkbox', False):
+        return 'checkbox'
+    if data.get('is_conditional_phone', False):
+        return 'conditional_phone'
+    if data.get('is_phone', False):
+        return 'phone'
+    if data.get('is_date', False):
+        return 'date'
+    if data.get('fill_sequential', False):
+        return 'sequential'
+    if data.get('use_boxes', False):
+        return 'boxes'
+    return 'text'
+
+
+def field_spec(data):
+    """
+    Resolve a field_data entry into a FieldSpec with all defaults filled in
+
+    Args:
+        data: Field dictionary from field_data
+
+    Returns:
+        FieldSpec for the field
+    """
+    # One merge over the defaults replaces a .get() per option
+    values = {**_FIELD_DEFAULTS, **data, 'kind': _field_kind(data)}
+    return FieldSpec._make(_field_spec_values(values))
+
+
+def _conditional_phone_positions(text, x, y, spec):
+    """Box positions for a phone field whose fill direction depends on its digits"""
+    return fill_conditional_phone_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        space_separator_width=spec.phone_space_separator_width,
+        space_after_position=spec.phone_space_position,
+        check_position=spec.phone_check_position,
+        check_value=spec.phone_check_value
+    )
+
+
+def _phone_positions(text, x, y, spec):
+    """Box positions for a phone field with a custom-width space separator"""
+    return fill_phone_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        space_separator_width=spec.phone_space_separator_width,
+        space_after_position=spec.phone_space_position,
+        add_leading_space=spec.phone_leading_space
+    )
+
+
+def _date_positions(text, x, y, spec):
+    """Box positions for a date field with narrower separator boxes"""
+    return fill_date_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        separator_width=spec.separator_width,
+        separator_char=spec.separator_char
+    )
+
+
+def _sequential_positions(text, x, y, spec):
+    """Box positions for sequential filling (no word wrapping)"""
+    return fill_sequential_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        boxes_per_row=spec.boxes_per_row,
+        row_height=spec.row_height,
+        max_rows=spec.max_rows,
+        skip_boxes=spec.skip_boxes,
+        skip_box_widths=spec.skip_box_widths,
+        fill_right_to_left=spec.fill_right_to_left
+    )
+
+
+def _character_box_positions(text, x, y, spec):
+    """Box positions for word-wrapped character boxes"""
+    return fill_character_boxes(
+        text, x, y,
+        box_width=spec.box_width,
+        box_spacing=spec.box_spacing,
+        boxes_per_row=spec.boxes_per_row,
+        row_height=spec.row_height,
+        max_rows=spec.max_rows,
+        remove_commas=spec.remove_commas,
+        respect_newlines=spec.respect_newlines
+    )
+
+
+# Field kind -> function returning its (char, x, y) box positions.
+# Kinds missing here ('text') are drawn as a single string.
+_BOX_LAYOUTS = {
+    'conditional_phone': _conditional_phone_positions,
+    'phone': _phone_positions,
+    'date': _date_positions,
+    'sequential': _sequential_positions,
+    'boxes': _character_box_positions,
+}
+
+
+def _draw_grid(can, width, height):
+    """
+    Draw a coordinate grid with 10-unit spacing and labels every 50 units
+
+    Args:
+        can: ReportLab canvas to draw on
+        width: Page width
+        height: Page height
+    """
+    can.setStrokeColorRGB(0.8, 0.8, 0.8)  # Light gray
+    can.setLineWidth(0.5)
+
+    # Build every grid line into one path so it is stroked with a single operator
+    grid = can.beginPath()
+
+    # Vertical lines (every 10 units along x-axis)
+    for x in range(0, int(width) + 1, 10):
+        grid.moveTo(x, 0)
+        grid.lineTo(x, height)
+
+    # Horizontal lines (every 10 units along y-axis from top)
+    for y_from_top in range(0, int(height) + 1, 10):
+        y_from_bottom = height - y_from_top
+        grid.moveTo(0, y_from_bottom)
+        grid.lineTo(width, y_from_bottom)
+
+    can.drawPath(grid, stroke=1, fill=0)
+
+    # Label every 50 units
+    can.setFont(OVERLAY_FONT_NAME, GRID_FONT_SIZE)
+
+    can.setFillColorRGB(1, 0, 0)  # Red text
+    for x in range(0, int(width) + 1, 50):
+        can.drawString(x + 2, height - 10, f"x={x}")  # Top
+        can.drawString(x + 2, 5, f"x={x}")  # Bottom
+
+    can.setFillColorRGB(0, 0, 1)  # Blue text
+    for y_from_top in range(0, int(height) + 1, 50):
+        y_from_bottom = height - y_from_top
+        can.drawString(2, y_from_bottom + 2, f"y={y_from_top}")  # Left
+        can.drawString(width - 35, y_from_bottom + 2, f"y={y_from_top}")  # Right
+
+    can.setFillColorRGB(0, 0, 0)  # Back to black
+
+
+@lru_cache(maxsize=4)
+def _grid_operators(width, height):
+    """
+    Render the coordinate grid once and cache its PDF operators
+
+    Args:
+        width: Page width
+        height: Page height
+
+    Returns:
+        Tuple of content stream operators that can be replayed on any overlay canvas
+    """
+    scratch = canvas.Canvas(io.BytesIO(), pagesize=(width, height),
+                            initialFontName=OVERLAY_FONT_NAME,
+                            initialFontSize=OVERLAY_FONT_SIZE)
+    _draw_grid(scratch, width, height)
+    return tuple(scratch._code)
+
 
 def create_overlay_pdf(field_data, draw_grid=False):
     """
@@ -488,174 +719,119 @@ def create_overlay_pdf(field_data, draw_grid=False):
     """
     packet = io.BytesIO()
 
-    # Get page size from original PDF
-    can = canvas.Canvas(packet, pagesize=A4)
+    # Get page size from original PDF. The overlay is only an intermediate that
+    # merge_page decodes straight away, so its content stream is left uncompressed
+    # rather than deflated here and inflated again in fill_pdf_with_overlay.
+    can = canvas.Canvas(packet, pagesize=A4,
+                        initialFontName=OVERLAY_FONT_NAME,
+                        initialFontSize=OVERLAY_FONT_SIZE,
+                        pageCompression=0)
     width, height = A4
 
-    # Draw grid if requested
+    # All field text goes into a single text object (one BT/ET block)
+    text_obj = can.beginText()
+
+    # Only emit a font change when the size actually differs from the last one
+    current_font_size = OVERLAY_FONT_SIZE
+
+    def set_font_size(font_size):
+        nonlocal current_font_size
+        if font_size != current_font_size:
+            text_obj.setFont(OVERLAY_FONT_NAME, font_size)
+            current_font_size = font_size
+
+    def draw_string(x, y, text):
+        """Add a string at an absolute position to the text object"""
+        text_obj.setTextOrigin(x, y)
+        text_obj.textOut(text)
+
+    def draw_box_chars(positions):
+        """Add one field's box characters to the text object"""
+        cursor = None
+        for char, char_x, char_y in positions:
+            if not char:
+                continue  # Only draw non-empty characters (skip separators)
+            x, y = char_x + 2, char_y - 3  # Slight offset for centering
+            if cursor is None:
+                text_obj.setTextOrigin(x, y)
+            else:
+                # Relative move from the previous character (positive dy moves down)
+                text_obj.moveCursor(x - cursor[0], cursor[1] - y)
+            text_obj.textOut(char)
+            cursor = (x, y)
+
+    # Draw grid if requested (operators are built once and replayed)
     if draw_grid:
-        can.setStrokeColorRGB(0.8, 0.8, 0.8)  # Light gray
-        can.setLineWidth(0.5)
-        can.setFont("Helvetica", 6)
-
-        # Draw vertical lines (every 10 units along x-axis)
-        for x in range(0, int(width) + 1, 10):
-            can.line(x, 0, x, height)
-            # Label every 50 units at top and bottom
-            if x % 50 == 0:
-                can.setFillColorRGB(1, 0, 0)  # Red text
-                can.drawString(x + 2, height - 10, f"x={x}")  # Top
-                can.drawString(x + 2, 5, f"x={x}")  # Bottom
-                can.setFillColorRGB(0, 0, 0)  # Back to black
-
-        # Draw horizontal lines (every 10 units along y-axis from top)
-        for y_from_top in range(0, int(height) + 1, 10):
-            y_from_bottom = height - y_from_top
-            can.line(0, y_from_bottom, width, y_from_bottom)
-            # Label every 50 units at left and right
-            if y_from_top % 50 == 0:
-                can.setFillColorRGB(0, 0, 1)  # Blue text
-                can.drawString(2, y_from_bottom + 2, f"y={y_from_top}")  # Left
-                can.drawString(width - 35, y_from_bottom + 2, f"y={y_from_top}")  # Right
-                can.setFillColorRGB(0, 0, 0)  # Back to black
-
-    # Try to use a standard font (Arial or Helvetica)
-    can.setFont("Helvetica", 10)
+        can._code.extend(_grid_operators(width, height))
+        current_font_size = GRID_FONT_SIZE  # Grid labels leave the font at this size
+
+    # Resolve every field once, then draw grouped by font size so same-size fields
+    # share one font change (sorted() is stable, so equal sizes keep their order)
+    specs = sorted(((field_name, field_spec(data)) for field_name, data in field_data.items()),
+                   key=lambda item: item[1].size)
 
     # Draw each field
-    for field_name, data in field_data.items():
-        text = data['text']
+    for field_name, spec in specs:
+        text = spec.text
 
         # Check if this is a checkbox/option field
-        if data.get('is_checkbox', False):
-            font_size = data.get('size', 10)
-            can.setFont("Helvetica", font_size)
-
-            checkbox_options = data.get('checkbox_options', {})
-            # Find which option matches the text
-            for option_value, coords in checkbox_options.items():
-                if text == option_value:
-                    # Draw the checkmark "/" at the specified coordinates
-                    check_x = coords['x']
-                    check_y = height - coords['y']  # Convert from top-left to bottom-left
-                    can.drawString(check_x, check_y, "/")
-                    print(f"Checkbox '{option_value}' marked at ({check_x}, {check_y})")
-                    break
+        if spec.kind == 'checkbox':
+            set_font_size(spec.size)
+
+            # Look up the option matching the text (options are keyed by their value)
+            coords = spec.checkbox_options.get(text)
+            if coords is not None:
+                # Draw the checkmark "/" at the specified coordinates
+                check_x = coords['x']
+                check_y = height - coords['y']  # Convert from top-left to bottom-left
+                draw_string(check_x, check_y, "/")
+                logger.debug("Checkbox %r marked at (%s, %s)", text, check_x, check_y)
             continue  # Skip to next field
 
         # Check if this field is conditional and should be skipped
-        if data.get('conditional_on', False):
-            parent_field = data.get('conditional_field')
-            required_value = data.get('conditional_value')
+        if spec.conditional_on:
             # Check if parent field exists and has the required value
-            if parent_field in field_data:
-                if field_data[parent_field].get('text') != required_value:
+            if spec.conditional_field in field_data:
+                if field_data[spec.conditional_field].get('text') != spec.conditional_value:
                     continue  # Skip this field
 
         # Apply IC number formatting if specified
-        if data.get('format_ic', False):
-            space_positions = data.get('ic_space_positions', [6, 8])
-            text = format_ic_number(text, space_positions)
-            print(f"IC formatted: '{data['text']}' -> '{text}'")
+        if spec.format_ic:
+            text = format_ic_number(text, spec.ic_space_positions)
+            logger.debug("IC formatted: %r -> %r", spec.text, text)
 
         # Apply phone number formatting if specified
-        if data.get('format_phone', False):
-            space_pos = data.get('phone_space_position', 3)
-            leading_space = data.get('phone_leading_space', False)
-            text = format_phone_number(text, space_after_position=space_pos, add_leading_space=leading_space)
-            print(f"Phone formatted: '{data['text']}' -> '{text}'")
+        if spec.format_phone:
+            text = format_phone_number(text, space_after_position=spec.phone_space_position,
+                                       add_leading_space=spec.phone_leading_space)
+            logger.debug("Phone formatted: %r -> %r", spec.text, text)
 
         # Apply decimal amount formatting if specified
-        if data.get('format_decimal', False):
+        if spec.format_decimal:
             formatted = format_decimal_amount(text)
             # Remove the decimal point - we only need the digits
             # The last 2 digits will go to Box 8 and 9, integer part fills right-to-left
             text = formatted.replace('.', '')
-            print(f"After removing decimal point: '{text}'")
+            logger.debug("After removing decimal point: %r", text)
 
         # Add leading space if single character and specified
-        if data.get('add_leading_space_if_single', False):
+        if spec.add_leading_space_if_single:
             if len(text.strip()) == 1:
                 text = ' ' + text.strip()
-                print(f"Added leading space for single character: '{data['text']}' -> '{text}'")
-
-        x = data['x']
-        y = height - data['y']  # Convert from top-left to bottom-left origin
-        font_size = data.get('size', 10)
-
-        can.setFont("Helvetica", font_size)
-
-        # Check if this is a conditional phone field (direction based on character check)
-        if data.get('is_conditional_phone', False):
-            positions = fill_conditional_phone_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                space_separator_width=data.get('phone_space_separator_width', 7),
-                space_after_position=data.get('phone_space_position', 3),
-                check_position=data.get('phone_check_position', 1),
-                check_value=data.get('phone_check_value', '1')
-            )
-            for char, char_x, char_y in positions:
-                if char:  # Only draw non-empty characters (skip separators)
-                    can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
-        # Check if this is a phone field with custom space separator width
-        elif data.get('is_phone', False):
-            positions = fill_phone_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                space_separator_width=data.get('phone_space_separator_width', 7),
-                space_after_position=data.get('phone_space_position', 3),
-                add_leading_space=data.get('phone_leading_space', False)
-            )
-            for char, char_x, char_y in positions:
-                if char:  # Only draw non-empty characters (skip separators)
-                    can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
-        # Check if this is a date field with special separator boxes
-        elif data.get('is_date', False):
-            positions = fill_date_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                separator_width=data.get('separator_width', 7),
-                separator_char=data.get('separator_char', '-')
-            )
-            for char, char_x, char_y in positions:
-                if char:  # Only draw non-empty characters (skip separators)
-                    can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
-        # Check if this field should use sequential box filling (no word wrapping)
-        elif data.get('fill_sequential', False):
-            positions = fill_sequential_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                boxes_per_row=data.get('boxes_per_row', 20),
-                row_height=data.get('row_height', 20),
-                max_rows=data.get('max_rows', 3),
-                skip_boxes=data.get('skip_boxes', []),
-                skip_box_widths=data.get('skip_box_widths', None),
-                fill_right_to_left=data.get('fill_right_to_left', False)
-            )
-            for char, char_x, char_y in positions:
-                can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
-        # Check if this field should use character boxes
-        elif data.get('use_boxes', False):
-            positions = fill_character_boxes(
-                text, x, y,
-                box_width=data.get('box_width', 15),
-                box_spacing=data.get('box_spacing', 2),
-                boxes_per_row=data.get('boxes_per_row', 20),
-                row_height=data.get('row_height', 20),
-                max_rows=data.get('max_rows', 3),
-                remove_commas=data.get('remove_commas', False),
-                respect_newlines=data.get('respect_newlines', False)
-            )
-            for char, char_x, char_y in positions:
-                can.drawString(char_x + 2, char_y - 3, char)  # Slight offset for centering
+                logger.debug("Added leading space for single character: %r -> %r", spec.text, text)
+
+        x = spec.x
+        y = height - spec.y  # Convert from top-left to bottom-left origin
+
+        set_font_size(spec.size)
+
+        layout = _BOX_LAYOUTS.get(spec.kind)
+        if layout is not None:
+            draw_box_chars(layout(text, x, y, spec))
         else:
-            can.drawString(x, y, text)
+            draw_string(x, y, text)
 
+    can.drawText(text_obj)
     can.save()
     packet.seek(0)
     return packet
@@ -665,45 +841,72 @@ def fill_pdf_with_overlay(input_pdf, output_pdf, field_data, draw_grid=False):
     Fill PDF by overlaying text at specific coordinates
 
     Args:
-        input_pdf: Path to input PDF file
-        output_pdf: Path to output filled PDF file
+        input_pdf: Path to input PDF file, or an io.BytesIO holding its bytes
+        output_pdf: Path to output filled PDF file, or a writable binary
+                    file object (e.g. io.BytesIO) to keep the result in memory
         field_data: Dictionary with field data and positions
         draw_grid: If True, draw coordinate grid on PDF
     """
     # Create overlay PDF
     overlay_pdf = create_overlay_pdf(field_data, draw_grid=draw_grid)
 
-    # Read the original PDF
-    original_pdf = PdfReader(input_pdf)
+    # Open the original PDF for an incremental update: its bytes are kept as-is
+    # and only the modified first page is appended after them on write
+    writer = PdfWriter(input_pdf, incremental=True)
     overlay = PdfReader(overlay_pdf)
 
-    # Create output PDF
-    writer = PdfWriter()
-
-    # Merge overlay with first page
-    page = original_pdf.pages[0]
-    page.merge_page(overlay.pages[0])
-    writer.add_page(page)
-
-    # Add remaining pages without modification
-    for page_num in range(1, len(original_pdf.pages)):
-        writer.add_page(original_pdf.pages[page_num])
+    # Merge overlay with first page (remaining pages are left untouched)
+    writer.pages[0].merge_page(overlay.pages[0])
 
     # Write output
-    with open(output_pdf, 'wb') as output_file:
-        writer.write(output_file)
+    if hasattr(output_pdf, 'write'):
+        writer.write(output_pdf)
+        logger.info("PDF filled successfully! Written to in-memory output")
+    else:
+        with open(output_pdf, 'wb') as output_file:
+            writer.write(output_file)
+        logger.info("PDF filled successfully! Saved to: %s", output_pdf)
 
-    print(f"PDF filled successfully! Saved to: {output_pdf}")
 
 if __name__ == "__main__":
     import os
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
     input_pdf = os.path.join(script_dir, "BORANG PEMBIAYAAN PERIBADI-1.pdf")
     output_pdf = os.path.join(script_dir, "BORANG PEMBIAYAAN PERIBADI-1 - Filled.pdf")
 
+    # Shared layout for the 9-box RM amount fields (income/expense section): the
+    # 3rd and 7th boxes are the printed separators, digits fill from the right
+    money_layout = {
+        "size": 9,
+        "format_decimal": True,  # Apply decimal formatting
+        "fill_sequential": True,
+        "box_width": 12,
+        "box_spacing": 0.3,
+        "boxes_per_row": 9,  # 9 boxes total
+        "row_height": 15,
+        "max_rows": 1,
+        "skip_boxes": [3, 7],  # Skip boxes 3 and 7
+        "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
+        "fill_right_to_left": True  # Fill from right to left
+    }
+
+    # Shared layout for the referee contact numbers (mobile vs landline by 2nd digit)
+    conditional_phone_layout = {
+        "size": 9,
+        "is_conditional_phone": True,  # Use conditional phone filling
+        "box_width": 12,
+        "box_spacing": 0.5,
+        "phone_space_separator_width": 7,
+        "phone_space_position": 3,
+        "phone_check_position": 1,  # Check 2nd character (0-indexed)
+        "phone_check_value": "1"  # If 2nd char is '1', fill left-to-right; otherwise right-to-left
+    }
+
     # Field data with coordinates (measured from top-left in points)
     # You'll need to adjust these coordinates based on the actual PDF layout
     # Uncomment fields one by one to test and adjust coordinates
@@ -1030,347 +1233,59 @@ if __name__ == "__main__":
              "max_rows": 1
          },
 
-        "No. Untuk Dihubungi Perujuk Tel Bimbit": {
-            "text": "0123456789",  # Mobile (2nd char = '1')
-            "x": 385,
-            "y": 320,
-            "size": 9,
-            "is_conditional_phone": True,  # Use conditional phone filling
-            "box_width": 12,
-            "box_spacing": 0.5,
-            "phone_space_separator_width": 7,
-            "phone_space_position": 3,
-            "phone_check_position": 1,  # Check 2nd character (0-indexed)
-            "phone_check_value": "1"  # If 2nd char is '1', fill left-to-right; otherwise right-to-left
-        },
+        "No. Untuk Dihubungi Perujuk Tel Bimbit": {"text": "0123456789", "x": 385, "y": 320, **conditional_phone_layout},  # Mobile (2nd char = '1')
 
-        "No. Untuk Dihubungi Perujuk Rumah": {
-            "text": "0387654321",  # Landline (2nd char = '3')
-            "x": 385,
-            "y": 333,
-            "size": 9,
-            "is_conditional_phone": True,  # Use conditional phone filling
-            "box_width": 12,
-            "box_spacing": 0.5,
-            "phone_space_separator_width": 7,
-            "phone_space_position": 3,
-            "phone_check_position": 1,  # Check 2nd character (0-indexed)
-            "phone_check_value": "1"  # If 2nd char is '1', fill left-to-right; otherwise right-to-left
-        },
+        "No. Untuk Dihubungi Perujuk Rumah": {"text": "0387654321", "x": 385, "y": 333, **conditional_phone_layout},  # Landline (2nd char = '3')
 
-        "No. Untuk Dihubungi Perujuk Pejabat": {
-            "text": "0398765432",  # Landline (2nd char = '3')
-            "x": 385,
-            "y": 347,
-            "size": 9,
-            "is_conditional_phone": True,  # Use conditional phone filling
-            "box_width": 12,
-            "box_spacing": 0.5,
-            "phone_space_separator_width": 7,
-            "phone_space_position": 3,
-            "phone_check_position": 1,  # Check 2nd character (0-indexed)
-            "phone_check_value": "1"  # If 2nd char is '1', fill left-to-right; otherwise right-to-left
-        },
+        "No. Untuk Dihubungi Perujuk Pejabat": {"text": "0398765432", "x": 385, "y": 347, **conditional_phone_layout},  # Landline (2nd char = '3')
 
         # SECTION F - LATAR BELAKANG KEWANGAN (FINANCIAL BACKGROUND)
 
         # PENDAPATAN (A) / INCOME (A)
 
-         "Gaji Bulanan Asas": {
-             "text": "5000",
-             "x": 46,
-             "y": 405,
-             "size": 9,
-             "format_decimal": True,  # Apply decimal formatting
-             "fill_sequential": True,
-             "box_width": 12,
-             "box_spacing": 0.3,
-             "boxes_per_row": 9,  # 9 boxes total
-             "row_height": 15,
-             "max_rows": 1,
-             "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-             "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-             "fill_right_to_left": True  # Fill from right to left
-         },
+         "Gaji Bulanan Asas": {"text": "5000", "x": 46, "y": 405, **money_layout},
 
-        "Pendapatan Suami / Isteri": {
-            "text": "1000",
-            "x": 46,
-            "y": 430,
-            "size": 9,
-            "format_decimal": True,  # Apply decimal formatting
-            "fill_sequential": True,
-            "box_width": 12,
-            "box_spacing": 0.3,
-            "boxes_per_row": 9,  # 9 boxes total
-            "row_height": 15,
-            "max_rows": 1,
-            "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-            "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-            "fill_right_to_left": True  # Fill from right to left
-        },
+        "Pendapatan Suami / Isteri": {"text": "1000", "x": 46, "y": 430, **money_layout},
 
-        "Lain-lain Pendapatan": {
-            "text": "500",
-            "x": 185,
-            "y": 405,
-            "size": 9,
-            "format_decimal": True,  # Apply decimal formatting
-            "fill_sequential": True,
-            "box_width": 12,
-            "box_spacing": 0.3,
-            "boxes_per_row": 9,  # 9 boxes total
-            "row_height": 15,
-            "max_rows": 1,
-            "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-            "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-            "fill_right_to_left": True  # Fill from right to left
-        },
+        "Lain-lain Pendapatan": {"text": "500", "x": 185, "y": 405, **money_layout},
 
-        "Jumlah Pendapatan": {
-            "text": "10500",
-            "x": 185,
-            "y": 445,
-            "size": 9,
-            "format_decimal": True,  # Apply decimal formatting
-            "fill_sequential": True,
-            "box_width": 12,
-            "box_spacing": 0.3,
-            "boxes_per_row": 9,  # 9 boxes total
-            "row_height": 15,
-            "max_rows": 1,
-            "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-            "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-            "fill_right_to_left": True  # Fill from right to left
-        },
+        "Jumlah Pendapatan": {"text": "10500", "x": 185, "y": 445, **money_layout},
 
         # PERBELANJAAN (B) / EXPENSES (B)
 
-         "Sara Hidup": {
-             "text": "3000",
-             "x": 337,
-             "y": 396,
-             "size": 9,
-             "format_decimal": True,  # Apply decimal formatting
-             "fill_sequential": True,
-             "box_width": 12,
-             "box_spacing": 0.3,
-             "boxes_per_row": 9,  # 9 boxes total
-             "row_height": 15,
-             "max_rows": 1,
-             "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-             "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-             "fill_right_to_left": True  # Fill from right to left
-         },
-
-         "Lain-lain Perbelanjaan": {
-             "text": "500",
-             "x": 337,
-             "y": 425,
-             "size": 9,
-             "format_decimal": True,  # Apply decimal formatting
-             "fill_sequential": True,
-             "box_width": 12,
-             "box_spacing": 0.3,
-             "boxes_per_row": 9,  # 9 boxes total
-             "row_height": 15,
-             "max_rows": 1,
-             "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-             "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-             "fill_right_to_left": True  # Fill from right to left
-         },
-
-         "Jumlah Perbelanjaan": {
-             "text": "3500",
-             "x": 439,
-             "y": 445,
-             "size": 9,
-             "format_decimal": True,  # Apply decimal formatting
-             "fill_sequential": True,
-             "box_width": 12,
-             "box_spacing": 0.3,
-             "boxes_per_row": 9,  # 9 boxes total
-             "row_height": 15,
-             "max_rows": 1,
-             "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-             "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-             "fill_right_to_left": True  # Fill from right to left
-         },
-
-         "Jumlah Ansuran Bulanan": {
-             "text": "2000",
-             "x": 465,
-             "y": 398,
-             "size": 9,
-             "format_decimal": True,  # Apply decimal formatting
-             "fill_sequential": True,
-             "box_width": 12,
-             "box_spacing": 0.3,
-             "boxes_per_row": 9,  # 9 boxes total
-             "row_height": 15,
-             "max_rows": 1,
-             "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-             "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-             "fill_right_to_left": True  # Fill from right to left
-         },
+         "Sara Hidup": {"text": "3000", "x": 337, "y": 396, **money_layout},
 
-         "Sewa Rumah": {
-             "text": "1200",
-             "x": 465,
-             "y": 422,
-             "size": 9,
-             "format_decimal": True,  # Apply decimal formatting
-             "fill_sequential": True,
-             "box_width": 12,
-             "box_spacing": 0.3,
-             "boxes_per_row": 9,  # 9 boxes total
-             "row_height": 15,
-             "max_rows": 1,
-             "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-             "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-             "fill_right_to_left": True  # Fill from right to left
-         },
+         "Lain-lain Perbelanjaan": {"text": "500", "x": 337, "y": 425, **money_layout},
 
-         "Pendapatan Bersih": {
-             "text": "7000",
-             "x": 320,
-             "y": 462,
-             "size": 9,
-             "format_decimal": True,  # Apply decimal formatting
-             "fill_sequential": True,
-             "box_width": 12,
-             "box_spacing": 0.3,
-             "boxes_per_row": 9,  # 9 boxes total
-             "row_height": 15,
-             "max_rows": 1,
-             "skip_boxes": [3, 7],  # Skip boxes 3 and 7
-             "skip_box_widths": {3: 8, 7: 6},  # Box 3 has width 8, Box 7 has width 6
-             "fill_right_to_left": True  # Fill from right to left
-         },
+         "Jumlah Perbelanjaan": {"text": "3500", "x": 439, "y": 445, **money_layout},
 
-        # BANK/FINANCING TABLE (Multiple rows possible - showing 1 example)
+         "Jumlah Ansuran Bulanan": {"text": "2000", "x": 465, "y": 398, **money_layout},
 
-         "Bank 1 Nama": {
-             "text": "Bank Rakyat",
-             "x": 30,
-             "y": 500,
-             "size": 8,
-             "use_boxes": False  # Free text in table cell
-         },
+         "Sewa Rumah": {"text": "1200", "x": 465, "y": 422, **money_layout},
 
-         "Bank 1 Jenis Pembiayaan": {
-             "text": "Personal Loan",
-             "x": 150,
-             "y": 500,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 1 No Akaun": {
-             "text": "123456789012",
-             "x": 270,
-             "y": 500,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 1 Bayaran Bulanan": {
-             "text": "500",
-             "x": 400,
-             "y": 500,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 1 Baki": {
-             "text": "15000",
-             "x": 500,
-             "y": 500,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 2 Nama": {
-             "text": "Bank Rakyat",
-             "x": 30,
-             "y": 510,
-             "size": 8,
-             "use_boxes": False  # Free text in table cell
-         },
-
-         "Bank 2 Jenis Pembiayaan": {
-             "text": "Personal Loan",
-             "x": 150,
-             "y": 510,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 2 No Akaun": {
-             "text": "123456789012",
-             "x": 270,
-             "y": 510,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 2 Bayaran Bulanan": {
-             "text": "500",
-             "x": 400,
-             "y": 510,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 2 Baki": {
-             "text": "15000",
-             "x": 500,
-             "y": 510,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 3 Nama": {
-             "text": "Bank Rakyat",
-             "x": 30,
-             "y": 520,
-             "size": 8,
-             "use_boxes": False  # Free text in table cell
-         },
-
-         "Bank 3 Jenis Pembiayaan": {
-             "text": "Personal Loan",
-             "x": 150,
-             "y": 520,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 3 No Akaun": {
-             "text": "123456789012",
-             "x": 270,
-             "y": 520,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 3 Bayaran Bulanan": {
-             "text": "500",
-             "x": 400,
-             "y": 520,
-             "size": 8,
-             "use_boxes": False
-         },
-
-         "Bank 3 Baki": {
-             "text": "15000",
-             "x": 500,
-             "y": 520,
-             "size": 8,
-             "use_boxes": False
-         },
+         "Pendapatan Bersih": {"text": "7000", "x": 320, "y": 462, **money_layout},
     }
 
+    # BANK/FINANCING TABLE: one entry per column, repeated for each row (rows differ only in y)
+    bank_cols = (
+        # (column name, x, size, sample text)
+        ("Nama", 30, 8, "Bank Rakyat"),
+        ("Jenis Pembiayaan", 150, 8, "Personal Loan"),
+        ("No Akaun", 270, 8, "123456789012"),
+        ("Bayaran Bulanan", 400, 8, "500"),
+        ("Baki", 500, 8, "15000"),
+    )
+
+    for row, y in enumerate((500, 510, 520), start=1):
+        for name, x, size, text in bank_cols:
+            field_data[f"Bank {row} {name}"] = {
+                "text": text,
+                "x": x,
+                "y": y,
+                "size": size,
+                "use_boxes": False  # Free text in table cell
+            }
+
     # Set to True to draw coordinate grid on PDF (helps with finding x,y positions)
     DRAW_GRID = False
 
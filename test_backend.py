@@ -1,85 +1,149 @@
 #!/usr/bin/env python3
 """
 Quick backend test - checks if PDF generation works
+
+Run with: pytest test_backend.py   (or: python test_backend.py)
 """
 
-print("=" * 60)
-print("BACKEND TEST - PDF Generation")
-print("=" * 60)
+import importlib
+import os
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+CIF1_PATH = os.path.join(PROJECT_ROOT, "templates", "BORANG_CIF-1.pdf")
+PEMBIAYAAN_PATH = os.path.join(PROJECT_ROOT, "templates", "BORANG_PEMBIAYAAN_PERIBADI.pdf")
+
 
 # Test 1: Import test
-print("\n1. Testing imports...")
-try:
+def test_imports():
+    """Both form fillers can be imported"""
     from form_fillers.cif1_filler import generate_cif1_pdf
     from form_fillers.pembiayaan_filler import generate_pembiayaan_pdf
-    print("   ✓ Imports successful")
-except ImportError as e:
-    print(f"   ✗ Import failed: {e}")
-    exit(1)
 
-# Test 2: PDF template check
-print("\n2. Checking PDF templates...")
-import os
-cif1_path = "templates/BORANG_CIF-1.pdf"
-pembiayaan_path = "templates/BORANG_PEMBIAYAAN_PERIBADI.pdf"
+    assert callable(generate_cif1_pdf)
+    assert callable(generate_pembiayaan_pdf)
 
-if os.path.exists(cif1_path):
-    print(f"   ✓ CIF-1 template found: {os.path.getsize(cif1_path)} bytes")
-else:
-    print(f"   ✗ CIF-1 template NOT found at: {cif1_path}")
 
-if os.path.exists(pembiayaan_path):
-    print(f"   ✓ Pembiayaan template found: {os.path.getsize(pembiayaan_path)} bytes")
-else:
-    print(f"   ✗ Pembiayaan template NOT found at: {pembiayaan_path}")
+# Test 2: PDF template check
+@pytest.mark.parametrize("template_path", [CIF1_PATH, PEMBIAYAAN_PATH])
+def test_pdf_template_exists(template_path):
+    """The blank PDF templates are in templates/"""
+    assert os.path.exists(template_path), f"Template NOT found at: {template_path}"
+    assert os.path.getsize(template_path) > 0
+
 
 # Test 3: CIF-1 PDF Generation
-print("\n3. Testing CIF-1 PDF generation...")
-test_data = {
-    'ic_number': '920315105438',
-    'name_ic': 'AHMAD FARIZ BIN ABDULLAH'
-}
-
-try:
-    pdf_buffer = generate_cif1_pdf(test_data)
-    pdf_size = len(pdf_buffer.getvalue())
-    print(f"   ✓ CIF-1 PDF generated successfully: {pdf_size} bytes")
-except Exception as e:
-    print(f"   ✗ CIF-1 generation failed: {e}")
-    import traceback
-    traceback.print_exc()
-    exit(1)
+def test_cif1_pdf_generation():
+    """A minimal CIF-1 submission produces a PDF"""
+    from form_fillers.cif1_filler import generate_cif1_pdf
+
+    test_data = {
+        'ic_number': '920315105438',
+        'name_ic': 'AHMAD FARIZ BIN ABDULLAH'
+    }
+
+    pdf_bytes = generate_cif1_pdf(test_data).getvalue()
+    assert pdf_bytes.startswith(b'%PDF'), "CIF-1 generation did not return a PDF"
+
 
 # Test 4: Pembiayaan PDF Generation
-print("\n4. Testing Pembiayaan PDF generation...")
-test_data = {
-    'ic_number': '920315105438',
-    'name': 'AHMAD FARIZ'
-}
-
-try:
-    pdf_buffer = generate_pembiayaan_pdf(test_data)
-    pdf_size = len(pdf_buffer.getvalue())
-    print(f"   ✓ Pembiayaan PDF generated successfully: {pdf_size} bytes")
-except Exception as e:
-    print(f"   ✗ Pembiayaan generation failed: {e}")
-    import traceback
-    traceback.print_exc()
-    exit(1)
-
-# Test 5: Flask app check
-print("\n5. Checking Flask app configuration...")
-try:
+def test_pembiayaan_pdf_generation():
+    """A minimal Pembiayaan submission produces a PDF"""
+    from form_fillers.pembiayaan_filler import generate_pembiayaan_pdf
+
+    test_data = {
+        'ic_number': '920315105438',
+        'name': 'AHMAD FARIZ'
+    }
+
+    pdf_bytes = generate_pembiayaan_pdf(test_data).getvalue()
+    assert pdf_bytes.startswith(b'%PDF'), "Pembiayaan generation did not return a PDF"
+
+
+# Test 5: Character box layout (regression: glyph positions must not move)
+CHARACTER_BOX_GEOMETRY = dict(box_width=10, box_spacing=2, boxes_per_row=5, row_height=20)
+
+
+@pytest.mark.parametrize("base_module", ["form_fillers.cif1_base", "form_fillers.pembiayaan_base"])
+@pytest.mark.parametrize("text, overrides, expected", [
+    # A single word longer than a row moves to the next row and overflows it
+    ("ABCDEFGHIJKL", {"max_rows": 3}, [
+        ('A', 100, 680), ('B', 112, 680), ('C', 124, 680), ('D', 136, 680),
+        ('E', 148, 680), ('F', 160, 680), ('G', 172, 680), ('H', 184, 680),
+        ('I', 196, 680), ('J', 208, 680), ('K', 220, 680), ('L', 232, 680),
+    ]),
+    # ... and is never cut off by max_rows
+    ("ABCDEFGHIJKLMNOP", {"max_rows": 2}, [
+        ('A', 100, 680), ('B', 112, 680), ('C', 124, 680), ('D', 136, 680),
+        ('E', 148, 680), ('F', 160, 680), ('G', 172, 680), ('H', 184, 680),
+        ('I', 196, 680), ('J', 208, 680), ('K', 220, 680), ('L', 232, 680),
+        ('M', 244, 680), ('N', 256, 680), ('O', 268, 680), ('P', 280, 680),
+    ]),
+    # Words that no longer fit within max_rows are dropped
+    ("AB CDE FGHI JK", {"boxes_per_row": 4, "max_rows": 2}, [
+        ('A', 100, 700), ('B', 112, 700),
+        ('C', 100, 680), ('D', 112, 680), ('E', 124, 680),
+    ]),
+    # A long word after a short one starts on the next row
+    ("AB CDEFGHIJ", {"boxes_per_row": 4, "max_rows": 3}, [
+        ('A', 100, 700), ('B', 112, 700),
+        ('C', 100, 680), ('D', 112, 680), ('E', 124, 680), ('F', 136, 680),
+        ('G', 148, 680), ('H', 160, 680), ('I', 172, 680), ('J', 184, 680),
+    ]),
+])
+def test_fill_character_boxes_positions(base_module, text, overrides, expected):
+    """Word wrapping, overflow and max_rows truncation keep their box positions"""
+    base = importlib.import_module(base_module)
+
+    positions = base.fill_character_boxes(text, 100, 700, **{**CHARACTER_BOX_GEOMETRY, **overrides})
+    assert list(positions) == expected
+
+
+# Test 6: Conditional phone direction (regression: mobile vs landline boxes)
+@pytest.mark.parametrize("text, expected", [
+    # Mobile (2nd digit '1'): left-to-right with the separator after 3 digits
+    ("0123456789", [
+        ('0', 385, 522), ('1', 397.5, 522), ('2', 410.0, 522), ('', 422.5, 522),
+        ('3', 430.0, 522), ('4', 442.5, 522), ('5', 455.0, 522), ('6', 467.5, 522),
+        ('7', 480.0, 522), ('8', 492.5, 522), ('9', 505.0, 522),
+    ]),
+    # Landline: right-aligned, so the last digit lands in the last box
+    ("0387654321", [
+        ('0', 397.5, 522), ('3', 410.0, 522), ('', 422.5, 522), ('8', 430.0, 522),
+        ('7', 442.5, 522), ('6', 455.0, 522), ('5', 467.5, 522), ('4', 480.0, 522),
+        ('3', 492.5, 522), ('2', 505.0, 522), ('1', 517.5, 522),
+    ]),
+    ("03876543", [
+        ('0', 397.5, 522), ('3', 410.0, 522), ('', 422.5, 522), ('8', 430.0, 522),
+        ('7', 442.5, 522), ('6', 455.0, 522), ('5', 467.5, 522), ('4', 480.0, 522),
+        ('3', 492.5, 522),
+    ]),
+])
+def test_fill_conditional_phone_boxes_direction(text, expected):
+    """Referee phone numbers fill left-to-right for mobiles, right-to-left otherwise"""
+    from form_fillers import pembiayaan_base as base
+
+    positions = base.fill_conditional_phone_boxes(
+        text, 385, 522, box_width=12, box_spacing=0.5, space_separator_width=7,
+        space_after_position=3, check_position=1, check_value='1'
+    )
+    assert list(positions) == expected
+
+
+# Test 7: Flask app check
+def test_flask_app_configuration():
+    """The Flask app loads with field limits for both forms"""
+    pytest.importorskip("flask")
     from app import app, CIF1_LIMITS, PEMBIAYAAN_LIMITS
-    print(f"   ✓ Flask app loaded")
-    print(f"   ✓ CIF-1 has {len(CIF1_LIMITS)} field limits configured")
-    print(f"   ✓ Pembiayaan has {len(PEMBIAYAAN_LIMITS)} field limits configured")
-except Exception as e:
-    print(f"   ✗ Flask app error: {e}")
-
-print("\n" + "=" * 60)
-print("RESULT: All backend tests passed! ✅")
-print("=" * 60)
-print("\nIf backend works but web doesn't, the issue is in JavaScript/frontend.")
-print("Please open browser console (F12) and send me the error messages.")
-print("=" * 60)
+
+    assert app is not None
+    assert CIF1_LIMITS, "CIF-1 has no field limits configured"
+    assert PEMBIAYAAN_LIMITS, "Pembiayaan has no field limits configured"
+
+
+if __name__ == "__main__":
+    # If backend works but web doesn't, the issue is in JavaScript/frontend:
+    # open the browser console (F12) and check the error messages.
+    sys.exit(pytest.main([__file__, "-v"]))